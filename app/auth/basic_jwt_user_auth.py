@@ -1,92 +1,420 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
-from fastapi import Depends, HTTPException, status
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, func
 from sqlalchemy.future import select
 
-from app.core.settings import settings
-from app.db.database import get_db_session
+from app.auth.jwt_cache import JWTCache, jwt_cache
+from app.core.settings import ALGORITHM, SECRET_KEY, logger, settings
+from app.db.database import AsyncSessionLocal
+from app.exc.auth import JWTSigningKeyNotConfiguredException
 from app.models import User
 from app.schemas import UserCreate, UserLogin, UserResponse
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 31
 
-token_auth_scheme = HTTPBearer()
+
+def calibrate_bcrypt_rounds(max_hash_ms: int) -> int:
+    """
+    Picks the highest bcrypt cost factor whose hashing time stays within the given budget on this machine.
+
+    Args:
+        max_hash_ms (int): The time budget in milliseconds for a single hash.
+
+    Returns:
+        int: The chosen number of rounds, never lower than `BCRYPT_MIN_ROUNDS`.
+    """
+    chosen = BCRYPT_MIN_ROUNDS
+    for rounds in range(BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS + 1):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds))
+        if (time.perf_counter() - started_at) * 1000 > max_hash_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+bcrypt_rounds = calibrate_bcrypt_rounds(settings.BCRYPT_MAX_HASH_MS)
+logger.info(f"Using {bcrypt_rounds} bcrypt rounds for a {settings.BCRYPT_MAX_HASH_MS} ms hashing budget")
+
+# Bearer tokens are read by `AuthMiddleware`, the scheme only documents the authentication in the OpenAPI schema
+token_auth_scheme = HTTPBearer(auto_error=False)
+
+
+def load_jwt_keys() -> tuple:
+    """
+    Prepares the keys used to sign and verify JWT tokens for the configured algorithm.
+
+    For `ES256` the PEM keys are parsed into key objects once, so they are not re-parsed on every call. For `HS256`
+    the shared secret is used for both operations.
+
+    Returns:
+        tuple: The signing key (None if no private key is configured) and the verifying key.
+    """
+    if ALGORITHM != "ES256":
+        return SECRET_KEY, SECRET_KEY
+    # PEM keys passed through .env files are usually kept on a single line with escaped newlines
+    private_key_pem = settings.JWT_PRIVATE_KEY_PEM.replace("\\n", "\n").encode()
+    public_key_pem = settings.JWT_PUBLIC_KEY_PEM.replace("\\n", "\n").encode()
+    signing_key = load_pem_private_key(private_key_pem, password=None) if private_key_pem else None
+    return signing_key, load_pem_public_key(public_key_pem)
+
+
+# The keys and accepted algorithms never change at runtime, so they are prepared once
+JWT_SIGNING_KEY, JWT_VERIFYING_KEY = load_jwt_keys()
+JWT_ALGORITHMS = (ALGORITHM,)
+ACCESS_TOKEN_EXPIRE_SECONDS = 15 * 60
+
+# Short-lived cache of authenticated users keyed by email, saves a database round-trip per request
+current_user_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# Built once so the per-request lookup reuses SQLAlchemy's compiled statement cache entry. Only the columns of
+# `UserResponse` are selected, which skips the password hash and the ORM identity map bookkeeping
+USER_BY_EMAIL_QUERY = select(User.id, User.username, User.email, User.role, User.created_at, User.updated_at).where(
+    func.lower(User.email) == bindparam("email")
+)
+
+# bcrypt is CPU-bound, so it runs on a bounded pool sized to the available cores instead of the event loop
+password_hashing_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="password-hashing")
+
+# Recently verified passwords, so repeated logins skip bcrypt. Entries are keyed by a digest computed with a key that
+# never leaves this process, so neither plain passwords nor digests that could be brute-forced elsewhere are kept
+verified_password_cache = TTLCache(maxsize=4096, ttl=300)
+VERIFIED_PASSWORD_CACHE_KEY = os.urandom(32)
+
+
+def _bcrypt_hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(bcrypt_rounds)).decode()
+
+
+def _bcrypt_verify(password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hashes a plain password without blocking the event loop.
+
+    Args:
+        password (str): The plain password to hash.
+
+    Returns:
+        str: The bcrypt hash of the password.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_hashing_executor, _bcrypt_hash, password)
+
+
+def get_bcrypt_rounds(hashed_password: str) -> int:
+    """
+    Reads the cost factor a bcrypt hash was created with.
+
+    Args:
+        hashed_password (str): A bcrypt hash in the `$2b$<rounds>$<salt and digest>` format.
+
+    Returns:
+        int: The number of rounds of the hash.
+    """
+    return int(hashed_password.split("$")[2])
+
+
+async def rehash_password_if_needed(password: str, hashed_password: str) -> str | None:
+    """
+    Hashes a verified password again if its stored hash uses fewer than the calibrated number of rounds.
+
+    Hashes created before the cost was raised are upgraded this way on the next successful login. The cost is
+    calibrated separately in every worker and can come out differently between workers or restarts, so hashes are
+    never downgraded: otherwise logins could keep rewriting the same hash back and forth.
+
+    Args:
+        password (str): The plain password, already verified against `hashed_password`.
+        hashed_password (str): The stored bcrypt hash.
+
+    Returns:
+        str | None: The new hash to store, or None if the stored one is up to date.
+    """
+    if get_bcrypt_rounds(hashed_password) >= bcrypt_rounds:
+        return None
+    new_hashed_password = await hash_password(password)
+    verified_password_cache[make_verified_password_key(password, new_hashed_password)] = True
+    return new_hashed_password
+
+
+def make_verified_password_key(password: str, hashed_password: str) -> bytes:
+    """
+    Builds the `verified_password_cache` key of a password and the hash it was checked against.
+
+    Changing a password changes its hash, so entries of the old password stop matching on their own.
+
+    Args:
+        password (str): The plain password.
+        hashed_password (str): The stored bcrypt hash.
+
+    Returns:
+        bytes: A keyed 32 byte BLAKE2b digest of the hash and the password.
+    """
+    # bcrypt hashes never contain a NUL byte, so the separator keeps every pair distinct
+    return hashlib.blake2b(
+        hashed_password.encode() + b"\0" + password.encode(), key=VERIFIED_PASSWORD_CACHE_KEY, digest_size=32
+    ).digest()
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """
+    Verifies a plain password against its hash without blocking the event loop.
+
+    Successful checks are remembered for a few minutes, so logging in again with the same password doesn't pay for
+    bcrypt. Failed checks are never cached.
+
+    Args:
+        password (str): The plain password to verify.
+        hashed_password (str): The stored bcrypt hash.
+
+    Returns:
+        bool: True if the password matches the hash, otherwise False.
+    """
+    cache_key = make_verified_password_key(password, hashed_password)
+    if cache_key in verified_password_cache:
+        return True
+    loop = asyncio.get_running_loop()
+    verified = await loop.run_in_executor(password_hashing_executor, _bcrypt_verify, password, hashed_password)
+    if verified:
+        verified_password_cache[cache_key] = True
+    return verified
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The HS256 header never changes, so it is serialized and encoded once
+HS256_HEADER_B64 = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _fast_hs256_encode(payload: dict) -> str:
+    # The tokens verify with PyJWT, but they aren't byte-for-byte identical to `jwt.encode` output: orjson writes
+    # non-ASCII claims as raw UTF-8 where PyJWT escapes them as \uXXXX. tests/test_access_token.py checks the
+    # round trip through `jwt.decode`
+    signing_input = HS256_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    signature = hmac.new(SECRET_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
 
 
 def create_access_token(data: UserCreate | UserLogin, expires_delta: timedelta | None = None) -> str:
     """
     Creates a JWT access token based on the provided user data.
 
+    HS256 tokens are assembled directly from a precomputed header and an HMAC-SHA256 signature, other algorithms
+    are encoded through PyJWT.
+
     Args:
-        data (UserCreate | UserLogin): The user data to encode in the token.
+        data (UserCreate | UserLogin): The user data to encode in the token. The password is never encoded.
         expires_delta (timedelta | None, optional): The token expiration time. If None, the token will expire
         after 15 minutes.
 
     Returns:
         str: The encoded JWT token.
+
+    Raises:
+        JWTSigningKeyNotConfiguredException: If `ES256` is configured without a private key, as on instances that
+        only verify tokens.
     """
-    to_encode = data.model_dump().copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    to_encode = data.model_dump(exclude={"password"})
+    expires_in = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
+    to_encode["exp"] = int(time.time()) + expires_in
+    if ALGORITHM == "HS256":
+        return _fast_hs256_encode(to_encode)
+    if JWT_SIGNING_KEY is None:
+        raise JWTSigningKeyNotConfiguredException()
+    encoded_jwt = jwt.encode(to_encode, JWT_SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def get_current_user_email_from_token(token=Depends(token_auth_scheme)) -> str:
+def decode_access_token(token: str) -> dict:
     """
-    Extracts and returns the current user's email from the JWT token.
+    Decodes and verifies a JWT access token.
 
     Args:
-        token (Depends): The JWT token extracted from the request headers using HTTPBearer.
+        token (str): The encoded JWT token.
 
     Returns:
-        str: The user's email extracted from the JWT token.
+        dict: The decoded token payload.
 
     Raises:
-        HTTPException: If the token is invalid or the email is not found in the token payload.
+        jwt.PyJWTError: If the token is invalid, has expired or has no `exp` claim.
+    """
+    return jwt.decode(token, JWT_VERIFYING_KEY, algorithms=JWT_ALGORITHMS, options={"require": ["exp"]})
+
+
+def build_credentials_exception() -> HTTPException:
+    """
+    Builds the 401 error returned for missing or invalid bearer tokens.
+
+    Returns:
+        HTTPException: The error asking the client to authenticate with a bearer token.
     """
-    credentials_exception = HTTPException(
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def get_token_payload(token: str | None) -> dict:
+    """
+    Verifies the bearer token of a request and returns its payload.
+
+    Args:
+        token (str | None): The encoded JWT token from the `Authorization` header, or None if the request has no
+        bearer token.
+
+    Returns:
+        dict: The decoded token payload, guaranteed to contain the user's email.
+
+    Raises:
+        HTTPException: If the token is missing, invalid or the email is not found in the token payload.
+    """
+    credentials_exception = build_credentials_exception()
+    if token is None:
+        raise credentials_exception
     try:
-        payload = jwt.decode(token.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("email")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+        payload = decode_access_token(token)
+    except jwt.PyJWTError:
+        raise credentials_exception
+    if payload.get("email") is None:
         raise credentials_exception
-    return email
+    return payload
 
 
-async def get_current_user(
-    session: AsyncSession = Depends(get_db_session),
-    current_user_email: str = Depends(get_current_user_email_from_token),
-) -> UserResponse:
+def invalidate_cached_user(email: str) -> None:
     """
-    Retrieves the current user from the database based on the extracted email from the token.
+    Removes a user and their verified tokens from the caches so the next request reloads them from the database.
+
+    Args:
+        email (str): The email of the user whose data has changed.
+    """
+    current_user_cache.pop(email, None)
+    jwt_cache.invalidate_user(email)
+
+
+async def load_current_user(current_user_email: str) -> UserResponse:
+    """
+    Retrieves a user by the email extracted from their token.
+
+    Users are served from a short-lived in-process cache and only loaded from the database on a cache miss.
+    The lookup uses its own short-lived session, so the connection goes back to the pool before the request
+    handler runs.
 
     Args:
-        session (AsyncSession): The SQLAlchemy asynchronous session for database access.
         current_user_email (str): The current user's email extracted from the token.
 
     Returns:
         UserResponse: The user data formatted as a UserResponse schema.
 
     Raises:
-        HTTPException: If the user is not found or the email is None.
+        HTTPException: If the user is not found.
     """
-    if current_user_email is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    current_user = (await session.execute(select(User).filter_by(email=current_user_email))).scalar_one_or_none()
+    cached_user = current_user_cache.get(current_user_email)
+    if cached_user is not None:
+        return cached_user
+    async with AsyncSessionLocal() as session:
+        current_user = (await session.execute(USER_BY_EMAIL_QUERY, {"email": current_user_email.lower()})).first()
     if current_user is not None:
-        return UserResponse.from_orm(current_user)
+        # The row comes straight from the database, so it is already typed and doesn't need revalidation
+        user = UserResponse.model_construct(**current_user._mapping)
+        current_user_cache[current_user_email] = user
+        return user
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+
+async def authenticate_token(cache: JWTCache, token: str | None) -> UserResponse:
+    """
+    Retrieves the user a bearer token belongs to.
+
+    Args:
+        cache (JWTCache): The cache of recently verified tokens, filled with the token once it's verified.
+        token (str | None): The encoded JWT token, or None if the request has no bearer token.
+
+    Returns:
+        UserResponse: The user data formatted as a UserResponse schema.
+
+    Raises:
+        HTTPException: If the token is missing or invalid, or the user is not found.
+    """
+    payload = get_token_payload(token)
+    user = await load_current_user(payload["email"])
+    cache.set(token, payload["exp"], user)
+    return user
+
+
+class CurrentUserLookup:
+    """
+    Lazily resolves the user a bearer token belongs to.
+
+    Nothing runs until the lookup is first awaited, so requests that never ask for the current user don't decode the
+    token or query the database. Tokens that were verified within the last few seconds resolve straight from the
+    cache, skipping both the signature check and the user lookup. The resolved user is kept, so awaiting the lookup
+    again doesn't repeat the work.
+
+    Attributes:
+        cache (JWTCache): The cache of recently verified tokens.
+        token (str | None): The encoded JWT token, or None if the request has no bearer token.
+        user (UserResponse | None): The resolved user, or None until the lookup has succeeded.
+    """
+
+    def __init__(self, cache: JWTCache, token: str | None):
+        """
+        Initializes a lookup that hasn't started yet.
+
+        Args:
+            cache (JWTCache): The cache of recently verified tokens.
+            token (str | None): The encoded JWT token, or None if the request has no bearer token.
+        """
+        self.cache = cache
+        self.token = token
+        self.user = None
+
+    def __await__(self):
+        """
+        Resolves the current user on the first await and returns the same user afterwards.
+
+        Returns:
+            UserResponse: The user data formatted as a UserResponse schema.
+
+        Raises:
+            HTTPException: If the token is missing or invalid, or the user is not found.
+        """
+        if self.user is None:
+            self.user = yield from self.resolve().__await__()
+        return self.user
+
+    async def resolve(self) -> UserResponse:
+        """
+        Retrieves the user of the token, from the cache of verified tokens when possible.
+
+        Returns:
+            UserResponse: The user data formatted as a UserResponse schema.
+
+        Raises:
+            HTTPException: If the token is missing or invalid, or the user is not found.
+        """
+        if self.token is None:
+            raise build_credentials_exception()
+        cached_user = self.cache.get(self.token)
+        if cached_user is not None:
+            return cached_user
+        return await authenticate_token(self.cache, self.token)
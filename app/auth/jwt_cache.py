@@ -0,0 +1,87 @@
+import hashlib
+import time
+
+from cachetools import TTLCache
+
+from app.schemas import UserResponse
+
+
+class JWTCache:
+    """
+    In-process cache of recently verified access tokens and the users they belong to.
+
+    Entries are keyed by a BLAKE2b digest of the raw token, so the tokens themselves are not kept in memory. An entry
+    expires after `ttl` seconds or once the `exp` claim of its token has passed, whichever comes first. None of the
+    methods await, so every operation is atomic on the event loop and no lock is needed.
+
+    Attributes:
+        entries (TTLCache): Mapping of token digests to the token expiry timestamp and the cached user.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: int = 15):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of cached tokens.
+            ttl (int): The number of seconds a verified token is trusted without being decoded again.
+        """
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        """
+        Builds the cache key for a token.
+
+        Args:
+            token (str): The encoded JWT token.
+
+        Returns:
+            bytes: A 16 byte BLAKE2b digest of the token.
+        """
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> UserResponse | None:
+        """
+        Returns the user of a previously verified token, evicting the entry if the token has expired.
+
+        Args:
+            token (str): The encoded JWT token.
+
+        Returns:
+            UserResponse | None: The cached user, or None if the token is not cached or has expired.
+        """
+        key = self.make_key(token)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.time():
+            self.entries.pop(key, None)
+            return None
+        return user
+
+    def set(self, token: str, expires_at: int, user: UserResponse) -> None:
+        """
+        Stores the user of a verified token.
+
+        Args:
+            token (str): The encoded JWT token.
+            expires_at (int): The `exp` claim of the token as a POSIX timestamp.
+            user (UserResponse): The user the token belongs to.
+        """
+        self.entries[self.make_key(token)] = (expires_at, user)
+
+    def invalidate_user(self, email: str) -> None:
+        """
+        Removes every cached token of a user, so their next request is verified and loaded again.
+
+        Args:
+            email (str): The email of the user whose data has changed.
+        """
+        for key, (_, user) in list(self.entries.items()):
+            if user.email == email:
+                self.entries.pop(key, None)
+
+
+jwt_cache = JWTCache()
@@ -0,0 +1,58 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.auth.basic_jwt_user_auth import CurrentUserLookup
+
+
+def get_bearer_token(headers: list[tuple[bytes, bytes]]) -> str | None:
+    """
+    Extracts the bearer token from raw ASGI request headers.
+
+    Args:
+        headers (list[tuple[bytes, bytes]]): The request headers as lowercased name and value pairs.
+
+    Returns:
+        str | None: The encoded JWT token, or None if the request has no bearer `Authorization` header.
+    """
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token
+            return None
+    return None
+
+
+class AuthMiddleware:
+    """
+    Pure ASGI middleware that attaches a lazy current user lookup to every HTTP request.
+
+    The lookup is stored as `request.state.user`. Handlers await it to get the current user or the 401/404 error of
+    an invalid token. It only starts on the first await, so routes that don't need a user, such as `/auth`,
+    `/healthcheck` and the docs, never decode the token or query the database.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Attaches the lazy current user lookup to the request state and passes the request on.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] == "http":
+            token = get_bearer_token(scope["headers"])
+            scope.setdefault("state", {})["user"] = CurrentUserLookup(scope["app"].state.jwt_cache, token)
+        await self.app(scope, receive, send)
@@ -1,2 +1,5 @@
 HEALTHY_HEALTHCHECK_RESPONSE = {"status": "healthy"}
-SELECT_1_Q = "SELECT 1"
+DB_HEALTHCHECK_CACHE_TTL = 1.0
+# How long a successful probe vouches for the database while the pool is too busy to check it again
+DB_HEALTHCHECK_BUSY_POOL_GRACE = 5 * DB_HEALTHCHECK_CACHE_TTL
+TASK_STREAM_BATCH_SIZE = 256
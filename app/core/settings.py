@@ -11,18 +11,32 @@ class Settings(BaseSettings):
     Attributes:
         APP_HOST (str): The host address where the FastAPI app will run.
         APP_PORT (int): The port number for the FastAPI app.
+        DEBUG (bool): Enables auto-reload for local development. Production runs use multiple workers instead.
         DB_USER (str): The username for the PostgreSQL database.
         DB_PASSWORD (str): The password for the PostgreSQL database.
         DB_HOST (str): The host address for the PostgreSQL database.
         DB_PORT (int): The port number for the PostgreSQL database.
         DB_NAME (str): The name of the PostgreSQL database.
+        DB_POOL_SIZE (int): The number of connections kept open in the connection pool.
+        DB_MAX_OVERFLOW (int): The number of extra connections allowed above the pool size under load.
+        DB_POOL_TIMEOUT (int): The number of seconds to wait for a free connection before giving up.
+        DB_POOL_RECYCLE (int): The number of seconds after which a pooled connection is recycled.
+        DB_PREPARED_STATEMENT_CACHE_SIZE (int): The number of prepared statements SQLAlchemy keeps per connection.
+        DB_STATEMENT_CACHE_SIZE (int): The size of asyncpg's own statement cache per connection.
         SECRET_KEY (str): The secret key used for JWT token encoding/decoding.
-        ALGORITHM (str): The algorithm used for JWT encoding.
+        ALGORITHM (str): The algorithm used for JWT encoding. `HS256` signs with `SECRET_KEY`, `ES256` signs with
+        the key pair below.
+        JWT_PRIVATE_KEY_PEM (str): The PEM encoded EC private key used to sign tokens with `ES256`. Can be left empty
+        on instances that only verify tokens.
+        JWT_PUBLIC_KEY_PEM (str): The PEM encoded EC public key used to verify tokens with `ES256`.
+        BCRYPT_MAX_HASH_MS (int): The time budget in milliseconds for a single bcrypt hash, used to pick the cost
+        factor at startup.
     """
 
     # FastAPI
     APP_HOST: str = "localhost"
     APP_PORT: int = 8000
+    DEBUG: bool = False
 
     # PostgreSQL
     DB_USER: str = "postgres"
@@ -30,10 +44,20 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
     DB_NAME: str = "postgres"
+    # Every worker process has its own pool, keep (DB_POOL_SIZE + DB_MAX_OVERFLOW) * workers <= max_connections
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512
+    DB_STATEMENT_CACHE_SIZE: int = 1024
 
     # Auth
     SECRET_KEY: str = "your_secret_key"
     ALGORITHM: str = "HS256"
+    JWT_PRIVATE_KEY_PEM: str = ""
+    JWT_PUBLIC_KEY_PEM: str = ""
+    BCRYPT_MAX_HASH_MS: int = 250
 
     class Config:
         """
@@ -48,6 +72,10 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
+# Values read on every authenticated request, bound once so the hot path skips the settings lookup
+SECRET_KEY: bytes = settings.SECRET_KEY.encode()
+ALGORITHM: str = settings.ALGORITHM
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -1,6 +1,5 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 from app.core.settings import settings
 
@@ -18,14 +17,28 @@ def build_async_db_url() -> str:
     )
 
 
-# Create an asynchronous SQLAlchemy engine
-async_engine = create_async_engine(build_async_db_url(), echo=False)
+# Create an asynchronous SQLAlchemy engine with a pool sized for the expected concurrency
+async_engine = create_async_engine(
+    build_async_db_url(),
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args={
+        # asyncpg's type introspection queries trigger the Postgres JIT, which makes new connections slow to set up
+        "server_settings": {"jit": "off"},
+        # Repeated statements reuse their server-side prepared statement instead of being parsed and planned again
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+)
 
-# Configure a sessionmaker for asynchronous sessions
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    autocommit=False,
+# Configure a sessionmaker for asynchronous sessions, request-scoped sessions don't need to expire objects on commit
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    expire_on_commit=False,
     autoflush=False,
 )
 
@@ -42,3 +55,17 @@ async def get_db_session() -> AsyncSession:
     """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_db_transaction() -> AsyncSession:
+    """
+    Dependency that provides an asynchronous database session wrapped in a transaction.
+
+    The transaction is committed when the request handler finishes successfully and rolled back if it raises,
+    so write endpoints return their connection to the pool as soon as the work is done.
+
+    Yields:
+        AsyncSession: An instance of the SQLAlchemy asynchronous session with an open transaction.
+    """
+    async with AsyncSessionLocal.begin() as session:
+        yield session
@@ -0,0 +1,25 @@
+class JWTSigningKeyNotConfiguredException(RuntimeError):
+    """
+    Exception raised when a token has to be signed but no signing key is configured.
+
+    This is a deployment error rather than a client one, so it is not a `DomainException` and surfaces as a 500
+    with the message logged.
+
+    Attributes:
+        message (str): The error message to be displayed.
+    """
+
+    def __init__(self, message: str = None):
+        """
+        Initializes the exception with an optional message.
+
+        Args:
+            message (str, optional): Custom error message. Defaults to a message naming the missing setting.
+        """
+        if message is None:
+            message = (
+                "Can't sign access tokens: ALGORITHM is ES256 but JWT_PRIVATE_KEY_PEM is not set. "
+                "Only instances that verify tokens may run without a private key."
+            )
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,12 @@
+class DomainException(Exception):
+    """
+    Base class for the errors raised by the services when a request can't be fulfilled.
+
+    Each subclass is mapped to an HTTP status code in `app.exc.handlers.DOMAIN_STATUS` and turned into a JSON error
+    response by a single application-wide exception handler.
+
+    Attributes:
+        message (str): The error message to be displayed.
+    """
+
+    message: str
@@ -0,0 +1,40 @@
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.core.settings import logger
+from app.exc.base import DomainException
+from app.exc.tasks import InvalidResponsiblePersonDataException, InvalidTaskPriorityException, TaskNotFoundException
+from app.exc.users import (
+    InvalidCredentialsForLoginException,
+    UserAlreadyExistsException,
+    UserNotFoundException,
+    UserPermissionsDeniedException,
+)
+
+DOMAIN_STATUS: dict[type[DomainException], int] = {
+    TaskNotFoundException: status.HTTP_404_NOT_FOUND,
+    UserNotFoundException: status.HTTP_404_NOT_FOUND,
+    UserPermissionsDeniedException: status.HTTP_403_FORBIDDEN,
+    InvalidTaskPriorityException: status.HTTP_400_BAD_REQUEST,
+    InvalidResponsiblePersonDataException: status.HTTP_400_BAD_REQUEST,
+    UserAlreadyExistsException: status.HTTP_400_BAD_REQUEST,
+    InvalidCredentialsForLoginException: status.HTTP_401_UNAUTHORIZED,
+}
+
+
+async def domain_exception_handler(request: Request, exc: DomainException) -> ORJSONResponse:
+    """
+    Converts a domain exception raised while handling a request into a JSON error response.
+
+    Args:
+        request (Request): The request that raised the exception.
+        exc (DomainException): The raised exception.
+
+    Returns:
+        ORJSONResponse: The response with the status code mapped to the exception type and its message as detail.
+    """
+    logger.warning("%s %s failed: %s", request.method, request.url.path, exc.message)
+    return ORJSONResponse(
+        status_code=DOMAIN_STATUS.get(type(exc), status.HTTP_400_BAD_REQUEST),
+        content={"detail": exc.message},
+    )
@@ -1,4 +1,7 @@
-class TaskNotFoundException(Exception):
+from app.exc.base import DomainException
+
+
+class TaskNotFoundException(DomainException):
     """
     Exception raised when a task with the specified ID is not found.
 
@@ -21,7 +24,7 @@ class TaskNotFoundException(Exception):
         super().__init__(self.message)
 
 
-class InvalidTaskPriorityException(Exception):
+class InvalidTaskPriorityException(DomainException):
     """
     Exception raised when an invalid priority is assigned to a task.
 
@@ -45,7 +48,7 @@ class InvalidTaskPriorityException(Exception):
         super().__init__(self.message)
 
 
-class InvalidResponsiblePersonDataException(Exception):
+class InvalidResponsiblePersonDataException(DomainException):
     """
     Exception raised when invalid data is assigned to a task.
 
@@ -1,4 +1,7 @@
-class UserAlreadyExistsException(Exception):
+from app.exc.base import DomainException
+
+
+class UserAlreadyExistsException(DomainException):
     """
     Exception raised when attempting to create a user that already exists.
 
@@ -19,7 +22,7 @@ class UserAlreadyExistsException(Exception):
         super().__init__(self.message)
 
 
-class InvalidCredentialsForLoginException(Exception):
+class InvalidCredentialsForLoginException(DomainException):
     """
     Exception raised when invalid credentials are provided during login.
 
@@ -41,7 +44,7 @@ class InvalidCredentialsForLoginException(Exception):
         super().__init__(self.message)
 
 
-class UserPermissionsDeniedException(Exception):
+class UserPermissionsDeniedException(DomainException):
     """
     Exception raised when a user attempts an action without the necessary permissions.
 
@@ -62,7 +65,7 @@ class UserPermissionsDeniedException(Exception):
         super().__init__(self.message)
 
 
-class UserNotFoundException(Exception):
+class UserNotFoundException(DomainException):
     """
     Exception raised when a user with a specified ID is not found.
 
@@ -1,19 +1,36 @@
+import os
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.core.settings import settings
+from app.auth.jwt_cache import jwt_cache
+from app.auth.middleware import AuthMiddleware
+from app.core.settings import logger, settings
+from app.exc.base import DomainException
+from app.exc.handlers import domain_exception_handler
 from app.routers.auth_routers import router as auth_router
 from app.routers.healthcheck_routers import router as healthcheck_router
 from app.routers.task_routers import router as task_router
+from app.services.email_service import EmailService
 
 app = FastAPI(
     title="Task Tracker Back-End",
     description="""
     Task Tracker Back-End - Test task
     """,
+    default_response_class=ORJSONResponse,
 )
 
+# Verified tokens are shared across requests through the application state
+app.state.jwt_cache = jwt_cache
+# A single email service is shared by all requests instead of being created for each one
+app.state.email_service = EmailService(logger=logger)
+
+app.add_exception_handler(DomainException, domain_exception_handler)
+
+app.add_middleware(AuthMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -26,4 +43,13 @@ app.include_router(auth_router)
 app.include_router(task_router)
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host=settings.APP_HOST, port=settings.APP_PORT, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host=settings.APP_HOST,
+        port=settings.APP_PORT,
+        reload=settings.DEBUG,
+        workers=None if settings.DEBUG else os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -15,6 +15,9 @@ class TaskExecutor(Base):
         user_id (Mapped[int]): The ID of the user. Part of the composite primary key.
         task (Mapped[Task]): The relationship to the `Task` model, linking a task to its executors.
         user (Mapped[User]): The relationship to the `User` model, representing the user executing the task.
+
+    The primary key leads with the task ID, so the tasks of an executor are looked up through the
+    `ix_task_executors_user` index instead.
     """
 
     __tablename__ = "task_executors"
@@ -24,3 +27,5 @@ class TaskExecutor(Base):
 
     task: Mapped[Task] = relationship("Task", back_populates="executors")
     user: Mapped[User] = relationship("User")
+
+    __table_args__ = (Index("ix_task_executors_user", "user_id", "task_id"),)
@@ -1,4 +1,6 @@
-from sqlalchemy import Enum, ForeignKey, Integer, String
+from functools import cached_property
+
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -23,6 +25,15 @@ class Task(Base):
         responsible_person (Mapped[User]): Relationship to the `User` model representing the person responsible
         for the task. executors (Mapped[list["TaskExecutor"]]): Relationship to the `TaskExecutor` model representing
        the list of executors assigned to the task.
+
+    Both relationships raise instead of lazy loading, since an implicit load cannot run under the async session.
+    Code that reads them loads them explicitly, e.g. with `selectinload`.
+
+    Server-generated timestamps are fetched with RETURNING as part of each INSERT and UPDATE (`eager_defaults`), so a
+    flushed task can be serialized without reloading it.
+
+    Task lists filtered by responsible person, status and priority and paginated by ID are served by the
+    `ix_tasks_filter` index.
     """
 
     __tablename__ = "tasks"
@@ -35,6 +46,19 @@ class Task(Base):
     created_at: Mapped[when_created]
     updated_at: Mapped[when_updated]
     responsible_person_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    responsible_person: Mapped[User] = relationship("User", back_populates="tasks")
+    responsible_person: Mapped[User] = relationship("User", back_populates="tasks", lazy="raise_on_sql")
+
+    executors: Mapped[list["TaskExecutor"]] = relationship("TaskExecutor", back_populates="task", lazy="raise_on_sql")
+
+    __table_args__ = (Index("ix_tasks_filter", "responsible_person_id", "status", "priority", "id"),)
+    __mapper_args__ = {"eager_defaults": True}
+
+    @cached_property
+    def executor_id_set(self) -> frozenset[int]:
+        """
+        The IDs of the users assigned to the task as executors, computed once per loaded task.
 
-    executors: Mapped[list["TaskExecutor"]] = relationship("TaskExecutor", back_populates="task")
+        Returns:
+            frozenset[int]: The user IDs of the task executors.
+        """
+        return frozenset(executor.user_id for executor in self.executors)
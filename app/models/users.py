@@ -1,4 +1,4 @@
-from sqlalchemy import Enum, String
+from sqlalchemy import Enum, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -20,6 +20,9 @@ class User(Base):
         updated_at (Mapped[when_updated]): The timestamp when the user was last updated.
         tasks (Mapped[list["Task"]]): Relationship to the `Task` model representing the list of tasks the user is
          responsible for.
+
+    Emails are looked up case-insensitively, backed by the unique `ix_users_email_lower` index on `lower(email)`.
+    Server-generated timestamps are fetched with RETURNING as part of each INSERT and UPDATE (`eager_defaults`).
     """
 
     __tablename__ = "users"
@@ -31,3 +34,6 @@ class User(Base):
     created_at: Mapped[when_created]
     updated_at: Mapped[when_updated]
     tasks: Mapped[list["Task"]] = relationship("Task", back_populates="responsible_person")
+
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
+    __mapper_args__ = {"eager_defaults": True}
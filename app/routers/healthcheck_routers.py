@@ -1,12 +1,16 @@
+import time
+
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import text
 
-from app.constants import HEALTHY_HEALTHCHECK_RESPONSE, SELECT_1_Q
-from app.core.settings import logger
+from app.constants import DB_HEALTHCHECK_BUSY_POOL_GRACE, DB_HEALTHCHECK_CACHE_TTL, HEALTHY_HEALTHCHECK_RESPONSE
+from app.core.settings import logger, settings
 from app.db.database import async_engine
 
 router = APIRouter(tags=["Health Check"], prefix="/healthcheck")
 
+# Monotonic time of the last successful database probe, shared by all probes of this process
+last_db_check_ok_at: float = 0.0
+
 
 @router.get("/app")
 def app_health_check():
@@ -24,8 +28,13 @@ async def db_health_check():
     """
     Health check endpoint to verify if the database connection is active.
 
-    Attempts to execute a simple query ("SELECT 1") against the database.
-    If the query is successful, the database is considered healthy.
+    Checks out a connection from the pool. The engine pre-pings every connection on checkout, so the checkout
+    itself costs one round trip to the server and fails if the database doesn't answer.
+
+    A successful result is reused for `DB_HEALTHCHECK_CACHE_TTL` seconds, and no connection is checked out while
+    the pool is exhausted by live traffic, so frequent probes don't compete with requests for pool capacity. A full
+    pool is only reported healthy while the last successful probe is at most `DB_HEALTHCHECK_BUSY_POOL_GRACE`
+    seconds old: a database that hangs also leaves every connection checked out, and must not look healthy forever.
 
     Returns:
         dict: A response indicating that the database is healthy.
@@ -33,10 +42,24 @@ async def db_health_check():
     Raises:
         HTTPException:
             - 500: If the database connection or query fails.
+            - 503: If the pool has been exhausted for longer than the grace period.
     """
+    global last_db_check_ok_at
+    if time.monotonic() - last_db_check_ok_at < DB_HEALTHCHECK_CACHE_TTL:
+        return HEALTHY_HEALTHCHECK_RESPONSE
+    if async_engine.pool.checkedout() >= settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW:
+        if time.monotonic() - last_db_check_ok_at < DB_HEALTHCHECK_BUSY_POOL_GRACE:
+            logger.info(f"Database health check skipped, pool is busy: {async_engine.pool.status()}")
+            return HEALTHY_HEALTHCHECK_RESPONSE
+        logger.error(f"Database health check failed, pool has been exhausted: {async_engine.pool.status()}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection pool is exhausted",
+        )
     try:
-        async with async_engine.connect() as conn:
-            await conn.execute(text(SELECT_1_Q))
+        async with async_engine.connect():
+            pass
+        last_db_check_ok_at = time.monotonic()
         return HEALTHY_HEALTHCHECK_RESPONSE
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
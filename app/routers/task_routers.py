@@ -1,31 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from app.auth.basic_jwt_user_auth import get_current_user
+from app.auth.basic_jwt_user_auth import token_auth_scheme
 from app.core.settings import logger
-from app.db.database import get_db_session
-from app.exc.tasks import InvalidResponsiblePersonDataException, InvalidTaskPriorityException, TaskNotFoundException
-from app.exc.users import UserNotFoundException, UserPermissionsDeniedException
 from app.schemas import TaskCreate, TaskResponse, TaskUpdate
 from app.schemas.tasks import Pagination, TaskFilters, TaskListResponse
-from app.services.tasks_service import TaskService
+from app.services.tasks_service import TaskService, get_task_service, get_task_service_in_transaction
+from app.utils.http_cache import build_task_etag, is_not_modified
 
-router = APIRouter(prefix="/tasks", tags=["tasks"])
+# The current user is resolved by `AuthMiddleware`, the scheme only marks the routes as secured in the OpenAPI schema
+router = APIRouter(prefix="/tasks", tags=["tasks"], dependencies=[Depends(token_auth_scheme)])
 
 
 @router.post("/", response_model=TaskResponse)
 async def create_task(
+    request: Request,
     task_data: TaskCreate,
-    session: AsyncSession = Depends(get_db_session),
-    current_user=Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service_in_transaction),
 ) -> TaskResponse:
     """
     Creates a new task in the system.
 
     Args:
+        request (Request): The incoming request, holding the lazy lookup of the current user.
         task_data (TaskCreate): The data required to create a new task.
-        session (AsyncSession): The database session dependency.
-        current_user: The currently authenticated user.
+        task_service (TaskService): The task service dependency.
 
     Returns:
         TaskResponse: The response model containing the created task details.
@@ -33,75 +32,98 @@ async def create_task(
     Raises:
         HTTPException: Various errors related to task creation, user permissions, and server issues.
     """
-    logger.info(f"Create task requested by user: {current_user.id} with data: {task_data}")
-    try:
-        task_service = TaskService(session)
-        result = await task_service.create_task(task_data, current_user)
-        logger.info(f"Task created successfully: {result.id}")
-        return result
-    except (InvalidTaskPriorityException, UserPermissionsDeniedException, InvalidResponsiblePersonDataException) as e:
-        logger.warning(f"Error during task creation: {e.message}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except UserNotFoundException as e:
-        logger.warning(f"User not found: {e.message}")
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unhandled exception during task creation: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    current_user = await request.state.user
+    logger.info("Create task requested by user: %s with data: %s", current_user.id, task_data)
+    result = await task_service.create_task(task_data, current_user)
+    logger.info("Task created successfully: %s", result.id)
+    return result
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_tasks(
+    request: Request,
+    task_service: TaskService = Depends(get_task_service),
+    filters: TaskFilters = Depends(),
+    after_id: int | None = Query(None, ge=0, description="Stream tasks after this ID (default is None)"),
+) -> StreamingResponse:
+    """
+    Streams every task matching the filters as newline-delimited JSON, one task per line.
+
+    Unlike the paginated list, the response is written while the tasks are read, so memory use and the time to the
+    first byte don't depend on the number of tasks.
+
+    Args:
+        request (Request): The incoming request, holding the lazy lookup of the current user.
+        task_service (TaskService): The task service dependency.
+        filters (TaskFilters): Filters to apply to the task list.
+        after_id (int | None): Only stream the tasks with an ID greater than this one.
+
+    Returns:
+        StreamingResponse: The `application/x-ndjson` stream of tasks, ordered by ID.
+
+    Raises:
+        HTTPException: Errors related to invalid filters and server issues.
+    """
+    current_user = await request.state.user
+    logger.info("Stream tasks requested by user: %s with filters: %s", current_user.id, filters)
+    lines = await task_service.stream_tasks(filters=filters, current_user=current_user, after_id=after_id)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
+    request: Request,
     task_id: int,
-    session: AsyncSession = Depends(get_db_session),
-    current_user=Depends(get_current_user),
-) -> TaskResponse:
+    task_service: TaskService = Depends(get_task_service),
+    if_none_match: str | None = Header(None),
+) -> Response:
     """
     Retrieves a specific task by its ID.
 
+    Responses carry a weak ETag derived from the task's last update. When the client sends it back in
+    `If-None-Match` and the task hasn't changed, an empty 304 response is returned instead of the task. The task
+    is built from trusted database values, so it is dumped straight into the response instead of being validated
+    against `TaskResponse` again.
+
     Args:
+        request (Request): The incoming request, holding the lazy lookup of the current user.
         task_id (int): The ID of the task to retrieve.
-        session (AsyncSession): The database session dependency.
-        current_user: The currently authenticated user.
+        task_service (TaskService): The task service dependency.
+        if_none_match (str | None): The ETag of the version of the task already held by the client.
 
     Returns:
-        TaskResponse: The response model containing the task details.
+        Response: The serialized `TaskResponse` containing the task details, or an empty 304 response.
 
     Raises:
         HTTPException: Errors related to task not found, user permissions, and server issues.
     """
-    logger.info(f"Get task requested by user: {current_user.id} for task ID: {task_id}")
-    try:
-        task_service = TaskService(session)
-        result = await task_service.get_task_by_id(task_id, current_user=current_user)
-        logger.info(f"Task retrieved successfully: {result.id}")
-        return result
-    except TaskNotFoundException as e:
-        logger.warning(f"Task not found: {e.message}")
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except UserPermissionsDeniedException as e:
-        logger.warning(f"Permission denied: {e.message}")
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unhandled exception during task retrieval: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    logger.info("Get task requested for task ID: %s", task_id)
+    result = await task_service.get_task_by_id(task_id, current_user_lookup=request.state.user)
+    logger.info("Task retrieved successfully: %s", result.id)
+    etag = build_task_etag(result)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if is_not_modified(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return ORJSONResponse(result.model_dump(mode="json"), headers=headers)
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
+    request: Request,
     task_id: int,
     task_data: TaskUpdate,
-    session: AsyncSession = Depends(get_db_session),
-    current_user=Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    task_service: TaskService = Depends(get_task_service_in_transaction),
 ) -> TaskResponse:
     """
     Updates a specific task by its ID.
 
     Args:
+        request (Request): The incoming request, holding the lazy lookup of the current user.
         task_id (int): The ID of the task to update.
         task_data (TaskUpdate): The updated task data.
-        session (AsyncSession): The database session dependency.
-        current_user: The currently authenticated user.
+        background_tasks (BackgroundTasks): The tasks run after the response is sent, such as email notifications.
+        task_service (TaskService): The task service dependency.
 
     Returns:
         TaskResponse: The response model containing the updated task details.
@@ -109,39 +131,26 @@ async def update_task(
     Raises:
         HTTPException: Errors related to task not found, user permissions, invalid priority, and server issues.
     """
-    logger.info(f"Update task requested by user: {current_user.id} for task ID: {task_id} with data: {task_data}")
-    try:
-        task_service = TaskService(session)
-        result = await task_service.update_task(task_id, task_data, current_user)
-        logger.info(f"Task updated successfully: {result.id}")
-        return result
-    except (TaskNotFoundException, UserNotFoundException) as e:
-        logger.warning(f"Task not found: {e.message}")
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except UserPermissionsDeniedException as e:
-        logger.warning(f"Permission denied: {e.message}")
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InvalidTaskPriorityException as e:
-        logger.warning(f"Invalid priority: {e.message}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unhandled exception during task update: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    logger.info("Update task requested for task ID: %s with data: %s", task_id, task_data)
+    current_user = await request.state.user
+    result = await task_service.update_task(task_id, task_data, current_user, background_tasks)
+    logger.info("Task updated successfully: %s", result.id)
+    return result
 
 
 @router.delete("/{task_id}", response_model=TaskResponse)
 async def delete_task(
+    request: Request,
     task_id: int,
-    session: AsyncSession = Depends(get_db_session),
-    current_user=Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service_in_transaction),
 ) -> TaskResponse:
     """
     Deletes a specific task by its ID.
 
     Args:
+        request (Request): The incoming request, holding the lazy lookup of the current user.
         task_id (int): The ID of the task to delete.
-        session (AsyncSession): The database session dependency.
-        current_user: The currently authenticated user.
+        task_service (TaskService): The task service dependency.
 
     Returns:
         TaskResponse: The response model containing the details of the deleted task.
@@ -149,54 +158,40 @@ async def delete_task(
     Raises:
         HTTPException: Errors related to task not found, user permissions, and server issues.
     """
-    logger.info(f"Delete task requested by user: {current_user.id} for task ID: {task_id}")
-    try:
-        task_service = TaskService(session)
-        result = await task_service.delete_task(task_id, current_user)
-        logger.info(f"Task deleted successfully: {task_id}")
-        return result
-    except TaskNotFoundException as e:
-        logger.warning(f"Task not found: {e.message}")
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except UserPermissionsDeniedException as e:
-        logger.warning(f"Permission denied: {e.message}")
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unhandled exception during task deletion: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    logger.info("Delete task requested for task ID: %s", task_id)
+    current_user = await request.state.user
+    result = await task_service.delete_task(task_id, current_user)
+    logger.info("Task deleted successfully: %s", task_id)
+    return result
 
 
 @router.get("/", response_model=TaskListResponse)
 async def list_tasks(
-    session: AsyncSession = Depends(get_db_session),
-    current_user=Depends(get_current_user),
+    request: Request,
+    task_service: TaskService = Depends(get_task_service),
     filters: TaskFilters = Depends(),
     pagination: Pagination = Depends(),
-) -> TaskListResponse:
+) -> ORJSONResponse:
     """
     Retrieves a list of tasks based on filters and pagination.
 
+    The list is built by the service from validated data, so it is dumped straight into the response instead of
+    being validated against `TaskListResponse` again. The response model only documents the schema.
+
     Args:
-        session (AsyncSession): The database session dependency.
-        current_user: The currently authenticated user.
+        request (Request): The incoming request, holding the lazy lookup of the current user.
+        task_service (TaskService): The task service dependency.
         filters (TaskFilters): Filters to apply to the task list.
         pagination (Pagination): Pagination parameters for the task list.
 
     Returns:
-        TaskListResponse: A response model containing a list of tasks and pagination info.
+        ORJSONResponse: The serialized `TaskListResponse` containing a list of tasks and pagination info.
 
     Raises:
-        HTTPException: Errors related to user not found and server issues.
+        HTTPException: Errors related to invalid filters and server issues.
     """
-    logger.info(f"List tasks requested by user: {current_user.id} with filters: {filters}")
-    try:
-        task_service = TaskService(session)
-        result = await task_service.get_tasks(filters=filters, current_user=current_user, pagination=pagination)
-        logger.info(f"Tasks retrieved successfully, total: {len(result.tasks)}")
-        return result
-    except UserNotFoundException as e:
-        logger.warning(f"User not found: {e.message}")
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unhandled exception during task listing: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    current_user = await request.state.user
+    logger.info("List tasks requested by user: %s with filters: %s", current_user.id, filters)
+    result = await task_service.get_tasks(filters=filters, current_user=current_user, pagination=pagination)
+    logger.info("Tasks retrieved successfully, total: %s", len(result.tasks))
+    return ORJSONResponse(result.model_dump(mode="json"))
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.enums.task_status import TaskStatus
 
@@ -19,13 +19,12 @@ class TaskCreate(BaseModel):
     """
 
     title: str
-    description: Optional[str]
+    description: Optional[str] = None
     priority: int
     status: TaskStatus = TaskStatus.TODO
     responsible_person_id: Optional[int]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class TaskUpdate(BaseModel):
@@ -40,12 +39,11 @@ class TaskUpdate(BaseModel):
     """
 
     title: Optional[str]
-    description: Optional[str]
+    description: Optional[str] = None
     priority: Optional[int]
     status: Optional[TaskStatus]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class TaskResponse(BaseModel):
@@ -65,15 +63,14 @@ class TaskResponse(BaseModel):
 
     id: int
     title: str
-    description: Optional[str]
+    description: Optional[str] = None
     priority: int
     status: TaskStatus
     responsible_person_id: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class TaskListResponse(BaseModel):
@@ -85,12 +82,17 @@ class TaskListResponse(BaseModel):
         total (int): Total number of tasks matching the query.
         page (int): Current page number.
         page_size (int): Number of tasks per page.
+        next_cursor (Optional[int]): ID of the last returned task, to be passed as `after_id` to fetch the next page.
+        None when there are no more tasks.
     """
 
     tasks: list[TaskResponse]
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[int] = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class TaskFilters(BaseModel):
@@ -107,6 +109,8 @@ class TaskFilters(BaseModel):
     priority: Optional[int] = None
     responsible_person_id: Optional[int] = None
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class Pagination(BaseModel):
     """
@@ -115,7 +119,14 @@ class Pagination(BaseModel):
     Attributes:
         page (int): Current page number. Default is 1.
         page_size (int): Number of items per page. Default is 10.
+        after_id (Optional[int]): Keyset cursor, returns the items with an ID greater than this one instead of
+        skipping `page` pages. Default is None.
     """
 
     page: int = Field(1, ge=1, description="Page number (default is 1)")
     page_size: int = Field(10, ge=1, le=100, description="Number of items per page (default is 10)")
+    after_id: Optional[int] = Field(
+        None, ge=0, description="Return items after this ID, takes precedence over page (default is None)"
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -1,22 +1,30 @@
 import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, constr
+from pydantic import BaseModel, ConfigDict, StringConstraints, constr
 
 from app.enums.user_role import UserRole
 
+# A light syntactic check, validated by pydantic-core itself instead of calling `email-validator` for every request
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+EmailAddress = Annotated[str, StringConstraints(strip_whitespace=True, pattern=EMAIL_PATTERN)]
+
 
 class UserLogin(BaseModel):
     """
     Schema for user login information.
 
     Attributes:
-        email (EmailStr): The email address of the user.
+        email (EmailAddress): The email address of the user.
         password (constr): The password of the user, with a minimum length of 8 characters.
     """
 
-    email: EmailStr
+    email: EmailAddress
     password: constr(min_length=8)
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class UserCreate(UserLogin):
     """
@@ -36,7 +44,7 @@ class UserResponse(BaseModel):
     Attributes:
         id (int): The unique identifier of the user.
         username (str): The username of the user.
-        email (EmailStr): The email address of the user.
+        email (str): The email address of the user.
         role (UserRole): The role of the user in the system, defined by the `UserRole` enum.
         created_at (datetime.datetime): The timestamp when the user was created.
         updated_at (datetime.datetime): The timestamp when the user was last updated.
@@ -44,13 +52,12 @@ class UserResponse(BaseModel):
 
     id: int
     username: str
-    email: EmailStr
+    email: str
     role: UserRole
     created_at: datetime.datetime
     updated_at: datetime.datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class JWTTokenDTO(BaseModel):
@@ -62,3 +69,5 @@ class JWTTokenDTO(BaseModel):
     """
 
     access_token: str
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
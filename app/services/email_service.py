@@ -14,6 +14,3 @@ class EmailService:
         self.logger.info(f"Sending email to {to_email}:")
         self.logger.info(f"Task title: {task_title}")
         self.logger.info(f"Status changed from '{old_status}' to '{new_status}'")
-        print(
-            f"Mock email sent to {to_email}: Task '{task_title}' status changed from '{old_status}' to '{new_status}'"
-        )
@@ -1,10 +1,16 @@
-from sqlalchemy import func, select
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, NoReturn
+
+from fastapi import BackgroundTasks, Depends, Request
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
-from app.core.settings import logger
+from app.constants import TASK_STREAM_BATCH_SIZE
+from app.db.database import AsyncSessionLocal, get_db_session, get_db_transaction
 from app.enums.user_role import UserRole
 from app.exc.tasks import TaskNotFoundException
+from app.exc.users import UserPermissionsDeniedException
 from app.models import Task, User
 from app.schemas.tasks import Pagination, TaskCreate, TaskFilters, TaskListResponse, TaskResponse, TaskUpdate
 from app.services.email_service import EmailService
@@ -18,8 +24,14 @@ from app.utils.user_permissions_check import (
     check_user_permissions_for_task_access,
     check_user_permissions_for_task_creation,
     check_user_permissions_for_task_delete,
+    task_access_predicate,
+    task_delete_predicate,
 )
 
+# Built once so loading a single task reuses SQLAlchemy's compiled statement cache entry instead of constructing and
+# hashing a new statement on every request
+TASK_BY_ID_QUERY = select(Task).options(selectinload(Task.executors)).where(Task.id == bindparam("task_id"))
+
 
 class TaskService:
     """
@@ -31,15 +43,40 @@ class TaskService:
         email_service (EmailService): Service used for sending email notifications.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, email_service: EmailService):
         """
-        Initializes the TaskService with a database session and sets up the email service.
+        Initializes the TaskService with a database session and the shared email service.
 
         Args:
             session (AsyncSession): The SQLAlchemy asynchronous session.
+            email_service (EmailService): The email service shared by all requests.
         """
         self.session = session
-        self.email_service = EmailService(logger=logger)
+        self.email_service = email_service
+
+    @staticmethod
+    def to_task_response(task: Task) -> TaskResponse:
+        """
+        Converts a task loaded from the database into its response model.
+
+        The values come straight from the database, so they are already typed and are not validated again.
+
+        Args:
+            task (Task): The task object.
+
+        Returns:
+            TaskResponse: The task details.
+        """
+        return TaskResponse.model_construct(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            priority=task.priority,
+            status=task.status,
+            responsible_person_id=task.responsible_person_id,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+        )
 
     async def create_task(self, task_data: TaskCreate, current_user: User) -> TaskResponse:
         """
@@ -71,9 +108,8 @@ class TaskService:
         )
         check_user_permissions_for_task_creation(current_user, responsible_person, new_task)
         self.session.add(new_task)
-        await self.session.commit()
-        await self.session.refresh(new_task)
-        return TaskResponse.from_orm(new_task)
+        await self.session.flush()
+        return self.to_task_response(new_task)
 
     async def get_task_by_id_or_404(self, task_id: int) -> Task:
         """
@@ -88,71 +124,42 @@ class TaskService:
         Raises:
             TaskNotFoundException: If the task is not found.
         """
-        result = await self.session.execute(
-            select(Task).options(selectinload(Task.executors)).where(Task.id == task_id)
-        )
+        result = await self.session.execute(TASK_BY_ID_QUERY, {"task_id": task_id})
         task = result.scalar_one_or_none()
         if not task:
             raise TaskNotFoundException(task_id=task_id)
         return task
 
-    async def get_task_by_id(self, task_id: int, current_user: User) -> TaskResponse:
+    async def get_task_by_id(self, task_id: int, current_user_lookup: Awaitable[User]) -> TaskResponse:
         """
         Retrieves a task by its ID and checks if the current user has access to it.
 
+        Loading the task doesn't depend on the user, so it runs concurrently with the user lookup, which reads
+        through a session of its own. Both are awaited to completion before either error is raised, so nothing is
+        left running on the request session. The task is always read from the database, so every worker serves the
+        latest version. Clients that already have it revalidate with its ETag instead of downloading it again.
+
         Args:
             task_id (int): The ID of the task to retrieve.
-            current_user (User): The user requesting the task.
+            current_user_lookup (Awaitable[User]): The pending lookup of the user requesting the task.
 
         Returns:
             TaskResponse: The task details.
 
         Raises:
+            HTTPException: If the user's token is missing or invalid, or the user is not found.
             TaskNotFoundException: If the task is not found.
             UserPermissionsDeniedException: If the user does not have permission to access the task.
         """
-        task = await self.get_task_by_id_or_404(task_id)
+        current_user, task = await asyncio.gather(
+            current_user_lookup, self.get_task_by_id_or_404(task_id), return_exceptions=True
+        )
+        if isinstance(current_user, BaseException):
+            raise current_user
+        if isinstance(task, BaseException):
+            raise task
         check_user_permissions_for_task_access(current_user, task)
-        return TaskResponse.from_orm(task)
-
-    async def update_fields(self, task_data: TaskUpdate, task: Task) -> Task:
-        """
-        Update task fields and send email notification if status changes.
-
-        Args:
-            task_data (TaskUpdate): The data to update in the task.
-            task (Task): The task object to update.
-
-        Returns:
-            Task: The updated task object.
-        """
-        old_status = task.status
-        task = self.update_task_fields(task, task_data)
-
-        if self.is_status_changed(old_status, task_data):
-            responsible_person = await self.get_responsible_person(task.responsible_person_id)
-            await self.send_status_change_notification(
-                task, responsible_person, task_data.status, old_status=old_status
-            )
-
-        return task
-
-    @staticmethod
-    def update_task_fields(task: Task, task_data: TaskUpdate) -> Task:
-        """
-        Update the task fields with the provided data.
-
-        Args:
-            task (Task): The task to update.
-            task_data (TaskUpdate): The new data for the task.
-
-        Returns:
-            Task: The updated task object.
-        """
-        update_fields = task_data.dict(exclude_unset=True)
-        for field, value in update_fields.items():
-            setattr(task, field, value)
-        return task
+        return self.to_task_response(task)
 
     @staticmethod
     def is_status_changed(old_status: str, task_data: TaskUpdate) -> bool:
@@ -169,48 +176,46 @@ class TaskService:
         new_status = task_data.status
         return new_status is not None and new_status != old_status
 
-    async def get_responsible_person(self, user_id: int) -> User:
-        """
-        Retrieve the responsible person from the database.
-
-        Args:
-            user_id (int): The ID of the responsible person.
-
-        Returns:
-            User: The user object.
-
-        Raises:
-            UserNotFoundException: If the user is not found.
-        """
-        return await get_user_by_id_or_404(user_id=user_id, session=self.session)
-
-    async def send_status_change_notification(
-        self, task: Task, responsible_person: User, new_status: str, old_status: str
+    def send_status_change_notification(
+        self, background_tasks: BackgroundTasks, task: Task, to_email: str, new_status: str, old_status: str
     ) -> None:
         """
-        Send an email notification to the responsible person if the task status changes.
+        Schedule an email notification to the responsible person about the task status change.
+
+        The email is sent by a background task once the response has been sent, so the request doesn't wait for it.
+        By then the update transaction has been committed and its connection returned to the pool, so a slow mail
+        server never holds a database connection.
 
         Args:
+            background_tasks (BackgroundTasks): The background tasks of the current request.
             task (Task): The task object.
-            responsible_person (User): The user to notify.
+            to_email (str): The email of the responsible person to notify.
             new_status (str): The new status of the task.
             old_status (str): The old status of the task.
         """
-        self.email_service.send_status_change_email(
-            to_email=responsible_person.email,
+        background_tasks.add_task(
+            self.email_service.send_status_change_email,
+            to_email=to_email,
             task_title=task.title,
             old_status=old_status,
             new_status=new_status,
         )
 
-    async def update_task(self, task_id: int, task_data: TaskUpdate, current_user: User) -> TaskResponse:
+    async def update_task(
+        self, task_id: int, task_data: TaskUpdate, current_user: User, background_tasks: BackgroundTasks
+    ) -> TaskResponse:
         """
         Updates a specific task by its ID.
 
+        The permission check is part of the UPDATE statement, which returns the updated task together with its
+        previous status and the email of its responsible person, so a permitted update takes a single round-trip,
+        including one that changes the status and notifies the responsible person.
+
         Args:
             task_id (int): The ID of the task to update.
             task_data (TaskUpdate): The updated data for the task.
             current_user (User): The user requesting the update.
+            background_tasks (BackgroundTasks): The background tasks the status change notification is added to.
 
         Returns:
             TaskResponse: The updated task details.
@@ -220,19 +225,34 @@ class TaskService:
             UserPermissionsDeniedException: If the user does not have permission to update the task.
             InvalidTaskPriorityException: If the task priority is not valid.
         """
-        task = await self.get_task_by_id_or_404(task_id)
-        check_user_permissions_for_task_access(current_user, task)
         check_task_priority(task_data.priority)
-        task = await self.update_fields(task_data, task)
-        self.session.add(task)
-        await self.session.commit()
-        await self.session.refresh(task)
-        return TaskResponse.from_orm(task)
+        previous = Task.__table__.alias("previous")
+        responsible_person_email = (
+            select(User.email).where(User.id == Task.responsible_person_id).scalar_subquery().label("email")
+        )
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.id == task_id, previous.c.id == Task.id, task_access_predicate(current_user))
+            .values(**task_data.model_dump(exclude_unset=True))
+            .returning(Task, previous.c.status, responsible_person_email)
+        )
+        row = result.first()
+        if row is None:
+            await self.raise_task_write_error(task_id, current_user, check_user_permissions_for_task_access)
+        task, old_status, responsible_person_email = row
+        if self.is_status_changed(old_status, task_data):
+            self.send_status_change_notification(
+                background_tasks, task, responsible_person_email, task_data.status, old_status=old_status
+            )
+        return self.to_task_response(task)
 
     async def delete_task(self, task_id: int, current_user: User) -> TaskResponse:
         """
         Deletes a specific task by its ID.
 
+        The permission check is part of the DELETE statement, which returns the deleted task, so a permitted
+        deletion takes a single round-trip.
+
         Args:
             task_id (int): The ID of the task to delete.
             current_user (User): The user requesting the deletion.
@@ -244,11 +264,32 @@ class TaskService:
             TaskNotFoundException: If the task is not found.
             UserPermissionsDeniedException: If the user does not have permission to delete the task.
         """
+        result = await self.session.execute(
+            delete(Task).where(Task.id == task_id, task_delete_predicate(current_user)).returning(Task)
+        )
+        task = result.scalar_one_or_none()
+        if task is None:
+            await self.raise_task_write_error(task_id, current_user, check_user_permissions_for_task_delete)
+        return self.to_task_response(task)
+
+    async def raise_task_write_error(
+        self, task_id: int, current_user: User, check_permissions: Callable[[User, Task], None]
+    ) -> NoReturn:
+        """
+        Raises the error explaining why an UPDATE or DELETE guarded by a permission predicate matched no task.
+
+        Args:
+            task_id (int): The ID of the task that was not changed.
+            current_user (User): The user who requested the change.
+            check_permissions (Callable[[User, Task], None]): The permission check matching the predicate.
+
+        Raises:
+            TaskNotFoundException: If the task is not found.
+            UserPermissionsDeniedException: If the user does not have permission to change the task.
+        """
         task = await self.get_task_by_id_or_404(task_id)
-        check_user_permissions_for_task_delete(task=task, current_user=current_user)
-        await self.session.delete(task)
-        await self.session.commit()
-        return TaskResponse.from_orm(task)
+        check_permissions(current_user, task)
+        raise UserPermissionsDeniedException()
 
     @staticmethod
     def apply_filters(query, filters: TaskFilters) -> None:
@@ -278,6 +319,8 @@ class TaskService:
         """
         Apply user access restrictions to the query based on the user's role.
 
+        The restriction is the SQL form of the task access check, so only the tasks the user may see are read.
+
         Args:
             query: The initial SQLAlchemy query object.
             current_user (User): The user requesting the data.
@@ -285,15 +328,39 @@ class TaskService:
         Returns:
             query: The modified query with access restrictions.
         """
-        if current_user.role in {UserRole.USER, UserRole.MANAGER}:
-            query = query.where(
-                (Task.responsible_person_id == current_user.id) | Task.executors.any(User.id == current_user.id)
-            )
-        return query
+        return query.where(task_access_predicate(current_user))
+
+    def build_filtered_query(self, filters: TaskFilters, current_user: User):
+        """
+        Build the query selecting the tasks that match the filters and are visible to the user.
+
+        The listed tasks are serialized from their own columns only, so no relationship is loaded with them, and
+        an accidental lazy load raises instead of issuing one query per task.
+
+        Args:
+            filters (TaskFilters): Filters to apply to the query.
+            current_user (User): The user requesting the data.
+
+        Returns:
+            query: The query object.
+        """
+        return self.apply_user_access_filter(
+            self.apply_filters(select(Task).options(raiseload("*")), filters),
+            current_user,
+        )
 
-    async def build_query(self, filters: TaskFilters, pagination: Pagination, current_user: User):
+    def build_query(self, filters: TaskFilters, pagination: Pagination, current_user: User):
         """
-        Build the query for retrieving tasks based on filters, pagination, and user access.
+        Build the query for retrieving a page of tasks based on filters, pagination, and user access.
+
+        Tasks are ordered by ID. When `pagination.after_id` is set the page starts right after that ID (keyset
+        pagination), which lets the database seek on the primary key instead of scanning and discarding the rows
+        of all previous pages.
+
+        Pages requested by number also carry a `total` column on every row, counting all the tasks that match the
+        filters with a `count(*) OVER ()` window in the same statement. Keyset pages select the tasks only: the
+        cursor condition can't be pushed through a window, which would make every keyset page read and sort all
+        matching rows, so their total is counted separately.
 
         Args:
             filters (TaskFilters): Filters to apply to the query.
@@ -301,24 +368,38 @@ class TaskService:
             current_user (User): The user requesting the data.
 
         Returns:
-            tuple: The query object and total count of tasks.
+            query: The query object selecting tasks for keyset pages and `(task, total)` rows otherwise.
         """
         limit = pagination.page_size
         offset = (pagination.page - 1) * pagination.page_size
-        query = self.apply_user_access_filter(
-            self.apply_filters(select(Task).options(selectinload(Task.executors)), filters),
-            current_user,
-        )
-        total_query = select(func.count()).select_from(query.subquery())
-        total = (await self.session.execute(total_query)).scalar()
-        query = query.limit(limit).offset(offset)
+        query = self.build_filtered_query(filters, current_user).order_by(Task.id).limit(limit)
+        if pagination.after_id is not None:
+            return query.where(Task.id > pagination.after_id)
+        return query.add_columns(func.count().over().label("total")).offset(offset)
+
+    async def count_tasks(self, filters: TaskFilters, current_user: User) -> int:
+        """
+        Counts the tasks that match the filters and are visible to the user.
 
-        return query, total
+        Args:
+            filters (TaskFilters): Filters to apply to the query.
+            current_user (User): The user requesting the data.
+
+        Returns:
+            int: The number of matching tasks.
+        """
+        query = select(func.count()).select_from(self.build_filtered_query(filters, current_user).subquery())
+        return (await self.session.execute(query)).scalar()
 
     async def get_tasks(self, filters: TaskFilters, pagination: Pagination, current_user: User) -> TaskListResponse:
         """
         Retrieves a list of tasks based on filters and pagination.
 
+        A page holds at most 100 tasks, so it is fetched in one buffered round trip and each row is converted to its
+        response straight from the result, without collecting the ORM objects in a list first. Pages requested by
+        number read the total from their rows, and only a page past the end of the results, which has no rows to
+        read it from, falls back to a separate count query. Keyset pages always count separately.
+
         Args:
             filters (TaskFilters): Filters to apply to the task list.
             pagination (Pagination): Pagination parameters for the task list.
@@ -328,18 +409,94 @@ class TaskService:
             TaskListResponse: The list of tasks and pagination info.
 
         Raises:
-            HTTPException: Errors related to user not found and server issues.
+            InvalidTaskPriorityException: If the priority in the filters is not valid.
         """
-        await check_filters_data(filters, self.session)
+        check_filters_data(filters)
 
-        query, total = await self.build_query(filters, pagination, current_user)
+        query = self.build_query(filters, pagination, current_user)
 
         result = await self.session.execute(query)
-        tasks = result.scalars().all()
-
-        return TaskListResponse(
-            tasks=[TaskResponse.from_orm(task) for task in tasks],
+        tasks = []
+        total = None
+        if pagination.after_id is not None:
+            for task in result.scalars():
+                tasks.append(self.to_task_response(task))
+            total = await self.count_tasks(filters, current_user)
+        else:
+            for task, total in result:
+                tasks.append(self.to_task_response(task))
+            if total is None:
+                total = await self.count_tasks(filters, current_user) if pagination.page > 1 else 0
+
+        return TaskListResponse.model_construct(
+            tasks=tasks,
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
+            next_cursor=tasks[-1].id if len(tasks) == pagination.page_size else None,
         )
+
+    async def stream_tasks(
+        self, filters: TaskFilters, current_user: User, after_id: int | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Validates the filters and prepares a stream of every task matching them, one JSON document per line.
+
+        Rows are read through a server-side cursor in batches of `TASK_STREAM_BATCH_SIZE`, so memory use doesn't
+        grow with the number of tasks. The stream runs after the request's session has been closed, so it reads
+        through a session of its own.
+
+        Args:
+            filters (TaskFilters): Filters to apply to the task list.
+            current_user (User): The user requesting the data.
+            after_id (int | None): Only stream the tasks with an ID greater than this one.
+
+        Returns:
+            AsyncIterator[str]: The NDJSON lines of the matching tasks, ordered by ID.
+
+        Raises:
+            InvalidTaskPriorityException: If the priority in the filters is not valid.
+        """
+        check_filters_data(filters)
+        query = self.build_filtered_query(filters, current_user).order_by(Task.id)
+        if after_id is not None:
+            query = query.where(Task.id > after_id)
+        query = query.execution_options(yield_per=TASK_STREAM_BATCH_SIZE)
+
+        async def generate_lines() -> AsyncIterator[str]:
+            async with AsyncSessionLocal() as session:
+                result = await session.stream(query)
+                async for task in result.scalars():
+                    yield self.to_task_response(task).model_dump_json() + "\n"
+
+        return generate_lines()
+
+
+async def get_task_service(request: Request, session: AsyncSession = Depends(get_db_session)) -> TaskService:
+    """
+    Provides a `TaskService` bound to the request's database session.
+
+    Args:
+        request (Request): The current request, whose application holds the shared email service.
+        session (AsyncSession): The database session dependency.
+
+    Returns:
+        TaskService: The task service for the current request.
+    """
+    return TaskService(session, request.app.state.email_service)
+
+
+async def get_task_service_in_transaction(
+    request: Request, session: AsyncSession = Depends(get_db_transaction)
+) -> TaskService:
+    """
+    Provides a `TaskService` bound to a database session whose transaction is committed once the request succeeds.
+
+    Args:
+        request (Request): The current request, whose application holds the shared email service.
+        session (AsyncSession): The transactional database session dependency.
+
+    Returns:
+        TaskService: The task service for the current request.
+    """
+    return TaskService(session, request.app.state.email_service)
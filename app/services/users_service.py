@@ -1,11 +1,20 @@
+from sqlalchemy import bindparam, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.auth.basic_jwt_user_auth import create_access_token, pwd_context
+from app.auth.basic_jwt_user_auth import (
+    create_access_token,
+    hash_password,
+    rehash_password_if_needed,
+    verify_password,
+)
 from app.exc.users import InvalidCredentialsForLoginException, UserAlreadyExistsException
 from app.models import User
 from app.schemas import JWTTokenDTO, UserCreate, UserLogin
 
+# Built once so the login and sign up lookups reuse SQLAlchemy's compiled statement cache entry
+USER_BY_EMAIL_QUERY = select(User).where(func.lower(User.email) == bindparam("email"))
+
 
 class UserService:
     """
@@ -26,7 +35,7 @@ class UserService:
 
     async def get_user_by_email(self, email: str) -> User:
         """
-        Retrieves a user by their email address.
+        Retrieves a user by their email address, ignoring case.
 
         Args:
             email (str): The email address of the user to retrieve.
@@ -34,7 +43,7 @@ class UserService:
         Returns:
             User: The user object if found, or None if no user exists with the provided email.
         """
-        result = await self.session.execute(select(User).filter_by(email=email))
+        result = await self.session.execute(USER_BY_EMAIL_QUERY, {"email": email.lower()})
         return result.scalar_one_or_none()
 
     async def sign_up_user(self, user: UserCreate) -> JWTTokenDTO:
@@ -52,17 +61,18 @@ class UserService:
         """
         if await self.get_user_by_email(user.email):
             raise UserAlreadyExistsException()
-        hashed_password = pwd_context.hash(user.password)
+        hashed_password = await hash_password(user.password)
         db_user = User(email=user.email, password=hashed_password, username=user.username)
         self.session.add(db_user)
-        await self.session.commit()
-        await self.session.refresh(db_user)
+        await self.session.flush()
         return JWTTokenDTO(access_token=create_access_token(data=user))
 
     async def login_user(self, user: UserLogin) -> JWTTokenDTO:
         """
         Authenticates a user and generates a JWT token if successful.
 
+        Passwords hashed with a lower bcrypt cost than the current one are hashed again and stored.
+
         Args:
             user (UserLogin): The user credentials for login.
 
@@ -73,6 +83,9 @@ class UserService:
             InvalidCredentialsForLoginException: If the provided credentials are invalid.
         """
         db_user = await self.get_user_by_email(user.email)
-        if not db_user or not pwd_context.verify(user.password, db_user.password):
+        if not db_user or not await verify_password(user.password, db_user.password):
             raise InvalidCredentialsForLoginException()
+        new_hashed_password = await rehash_password_if_needed(user.password, db_user.password)
+        if new_hashed_password is not None:
+            db_user.password = new_hashed_password
         return JWTTokenDTO(access_token=create_access_token(data=user))
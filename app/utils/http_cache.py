@@ -0,0 +1,31 @@
+from app.schemas import TaskResponse
+
+
+def build_task_etag(task: TaskResponse) -> str:
+    """
+    Builds a weak entity tag for a task from its last update timestamp.
+
+    Args:
+        task (TaskResponse): The task to tag.
+
+    Returns:
+        str: The weak ETag of the current version of the task.
+    """
+    return f'W/"{task.id}-{int(task.updated_at.timestamp() * 1_000_000)}"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """
+    Checks whether the client already holds the current version of a resource.
+
+    Args:
+        if_none_match (str | None): The value of the `If-None-Match` request header.
+        etag (str): The ETag of the current version of the resource.
+
+    Returns:
+        bool: True if the header matches the ETag, so a 304 response can be sent instead of the resource.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
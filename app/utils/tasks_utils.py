@@ -1,4 +1,3 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exc.tasks import InvalidResponsiblePersonDataException, InvalidTaskPriorityException
@@ -11,13 +10,17 @@ def check_task_priority(priority: int) -> None:
     """
     Validates if the given task priority is within the acceptable range (0 to 3).
 
+    Clearing the two low bits leaves a non-zero value for anything above 3 and for every negative number, so the
+    range is checked with a single mask instead of two comparisons. Values that are not plain integers, such as
+    None or booleans, are rejected as well.
+
     Args:
         priority (int): The priority of the task to be checked.
 
     Raises:
         InvalidTaskPriorityException: If the priority is outside the range of 0 to 3.
     """
-    if not (0 <= priority <= 3):
+    if priority.__class__ is not int or priority & ~3:
         raise InvalidTaskPriorityException(priority=priority)
 
 
@@ -40,6 +43,9 @@ async def get_user_by_id_or_404(session: AsyncSession, user_id: int) -> User:
     """
     Retrieves a user by ID or raises a 404 exception if not found.
 
+    Users already loaded by the session are returned from its identity map, so resolving the same user more than
+    once within a request costs a single query.
+
     Args:
         session (AsyncSession): The SQLAlchemy asynchronous session used for database operations.
         user_id (int): The ID of the user to retrieve.
@@ -50,26 +56,24 @@ async def get_user_by_id_or_404(session: AsyncSession, user_id: int) -> User:
     Raises:
         UserNotFoundException: If no user is found with the given ID.
     """
-    result = await session.execute(select(User).filter_by(id=user_id))
-    responsible_person = result.scalar_one_or_none()
+    responsible_person = await session.get(User, user_id)
     if not responsible_person:
         raise UserNotFoundException(user_id=user_id)
     return responsible_person
 
 
-async def check_filters_data(filters: TaskFilters, session: AsyncSession) -> None:
+def check_filters_data(filters: TaskFilters) -> None:
     """
-    Validates the provided task filters by checking the existence of users and the validity of task priority.
+    Validates the provided task filters by checking the validity of task priority.
+
+    The responsible person ID is not looked up: filtering by a user who doesn't exist matches no tasks, so the list
+    is simply empty and no extra query is needed to tell the two cases apart.
 
     Args:
         filters (TaskFilters): The filters provided for querying tasks.
-        session (AsyncSession): The SQLAlchemy asynchronous session used for database operations.
 
     Raises:
-        UserNotFoundException: If the responsible person ID in the filters is not found.
         InvalidTaskPriorityException: If the priority in the filters is not within the acceptable range.
     """
-    if filters.responsible_person_id:
-        await get_user_by_id_or_404(user_id=filters.responsible_person_id, session=session)
     if filters.priority is not None:
         check_task_priority(filters.priority)
@@ -1,6 +1,8 @@
+from sqlalchemy import ColumnElement, exists, true
+
 from app.enums.user_role import UserRole
 from app.exc.users import UserPermissionsDeniedException
-from app.models import Task, User
+from app.models import Task, TaskExecutor, User
 
 
 def check_user_permissions_for_task_creation(current_user: User, responsible_person: User, task: Task) -> None:
@@ -16,7 +18,7 @@ def check_user_permissions_for_task_creation(current_user: User, responsible_per
         UserPermissionsDeniedException: If the current user does not have permission to create the task.
     """
     if current_user.role == UserRole.USER and not (
-        task.responsible_person_id == current_user.id or current_user in task.executors
+        task.responsible_person_id == current_user.id or current_user.id in task.executor_id_set
     ):
         raise UserPermissionsDeniedException()
     elif current_user.role == UserRole.MANAGER and responsible_person.role == UserRole.ADMIN:
@@ -39,7 +41,7 @@ def check_user_permissions_for_task_access(current_user: User, task: Task) -> No
         UserPermissionsDeniedException: If the current user does not have permission to access the task.
     """
     if current_user.role in {UserRole.USER, UserRole.MANAGER}:
-        if task.responsible_person_id != current_user.id and current_user not in task.executors:
+        if task.responsible_person_id != current_user.id and current_user.id not in task.executor_id_set:
             raise UserPermissionsDeniedException(
                 message="Permission denied. Users and Managers can only access their own tasks."
             )
@@ -57,7 +59,7 @@ def check_user_permissions_for_task_delete(current_user: User, task: Task) -> No
         UserPermissionsDeniedException: If the current user does not have permission to delete the task.
     """
     if current_user.role == UserRole.MANAGER:
-        if task.responsible_person_id != current_user.id and current_user not in task.executors:
+        if task.responsible_person_id != current_user.id and current_user.id not in task.executor_id_set:
             raise UserPermissionsDeniedException(
                 message="Managers can only delete tasks they are responsible for or involved in."
             )
@@ -65,3 +67,51 @@ def check_user_permissions_for_task_delete(current_user: User, task: Task) -> No
     elif current_user.role == UserRole.USER:
         if task.responsible_person_id != current_user.id:
             raise UserPermissionsDeniedException(message="Users can only delete tasks they are responsible for.")
+
+
+def is_task_executor(current_user: User) -> ColumnElement[bool]:
+    """
+    Builds the SQL condition matching tasks the user is assigned to as an executor.
+
+    The condition reads the `task_executors` association table directly instead of going through
+    `Task.executors.any(...)`, which would also join `users` although only the user ID is compared.
+
+    Args:
+        current_user (User): The user whose assignments are checked.
+
+    Returns:
+        ColumnElement[bool]: An EXISTS condition on the `task_executors` table, correlated with `tasks`.
+    """
+    return exists().where(TaskExecutor.task_id == Task.id, TaskExecutor.user_id == current_user.id)
+
+
+def task_access_predicate(current_user: User) -> ColumnElement[bool]:
+    """
+    Builds the SQL counterpart of `check_user_permissions_for_task_access`, matching the tasks the user may access.
+
+    Args:
+        current_user (User): The user attempting to access the tasks.
+
+    Returns:
+        ColumnElement[bool]: The condition to add to the WHERE clause of a statement on `tasks`.
+    """
+    if current_user.role in {UserRole.USER, UserRole.MANAGER}:
+        return (Task.responsible_person_id == current_user.id) | is_task_executor(current_user)
+    return true()
+
+
+def task_delete_predicate(current_user: User) -> ColumnElement[bool]:
+    """
+    Builds the SQL counterpart of `check_user_permissions_for_task_delete`, matching the tasks the user may delete.
+
+    Args:
+        current_user (User): The user attempting to delete the tasks.
+
+    Returns:
+        ColumnElement[bool]: The condition to add to the WHERE clause of a statement on `tasks`.
+    """
+    if current_user.role == UserRole.MANAGER:
+        return (Task.responsible_person_id == current_user.id) | is_task_executor(current_user)
+    elif current_user.role == UserRole.USER:
+        return Task.responsible_person_id == current_user.id
+    return true()
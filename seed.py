@@ -1,10 +1,10 @@
 import asyncio
 
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.basic_jwt_user_auth import pwd_context
-from app.db.database import AsyncSessionLocal
+from app.auth.basic_jwt_user_auth import hash_password
+from app.db.database import AsyncSessionLocal, async_engine
 from app.enums.user_role import UserRole
 from app.models import User
 
@@ -16,9 +16,9 @@ async def create_initial_users(session: AsyncSession) -> None:
     Args:
         session (AsyncSession): The SQLAlchemy asynchronous session.
 
-    This function checks for existing users with predefined emails
-    and creates new users with specific roles (ADMIN, MANAGER, USER)
-    if they are not found in the database.
+    The passwords are hashed concurrently, and all users are inserted with a single
+    `INSERT ... ON CONFLICT DO NOTHING`, so users that already exist are skipped
+    without reading the existing emails first.
     """
     # List of initial users to be created
     users = [
@@ -42,19 +42,14 @@ async def create_initial_users(session: AsyncSession) -> None:
         },
     ]
 
-    existing_emails_query = await session.execute(select(User.email))
-    existing_emails = {email for email, in existing_emails_query.all()}
+    hashed_passwords = await asyncio.gather(*(hash_password(user_data["password"]) for user_data in users))
+    rows = [{**user_data, "password": hashed_password} for user_data, hashed_password in zip(users, hashed_passwords)]
 
-    for user_data in users:
-        if user_data["email"] not in existing_emails:
-            user = User(
-                username=user_data["username"],
-                email=user_data["email"],
-                password=pwd_context.hash(user_data["password"]),
-                role=user_data["role"],
-            )
-            session.add(user)
-            print(f"Created user: {user.username} with role {user.role}")
+    result = await session.execute(
+        insert(User).values(rows).on_conflict_do_nothing().returning(User.username, User.role)
+    )
+    for username, role in result.all():
+        print(f"Created user: {username} with role {role}")
 
     await session.commit()
 
@@ -63,11 +58,15 @@ async def main():
     """
     Main function to create initial users in the database.
 
-    Establishes a database session and calls the `create_initial_users` function
-    to ensure predefined users exist in the system.
+    Establishes a database session from the application's shared session factory and calls the
+    `create_initial_users` function to ensure predefined users exist in the system. The pooled connections
+    are closed before the event loop shuts down.
     """
-    async with AsyncSessionLocal() as session:
-        await create_initial_users(session)
+    try:
+        async with AsyncSessionLocal() as session:
+            await create_initial_users(session)
+    finally:
+        await async_engine.dispose()
 
 
 if __name__ == "__main__":
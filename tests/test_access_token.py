@@ -0,0 +1,32 @@
+import time
+
+import jwt
+import pytest
+
+from app.auth.basic_jwt_user_auth import _fast_hs256_encode
+from app.core.settings import SECRET_KEY
+
+
+@pytest.mark.parametrize("username", ["user", "Zoë", "用户"])
+def test_fast_hs256_token_round_trips_through_pyjwt(username):
+    payload = {"username": username, "email": "user@example.com", "exp": int(time.time()) + 60}
+
+    token = _fast_hs256_encode(payload)
+
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    assert jwt.decode(token, SECRET_KEY, algorithms=["HS256"], options={"require": ["exp"]}) == payload
+
+
+def test_fast_hs256_token_with_tampered_payload_is_rejected():
+    header, _, signature = _fast_hs256_encode({"email": "user@example.com", "exp": int(time.time()) + 60}).split(".")
+    forged_payload = _fast_hs256_encode({"email": "admin@example.com", "exp": int(time.time()) + 60}).split(".")[1]
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt.decode(f"{header}.{forged_payload}.{signature}", SECRET_KEY, algorithms=["HS256"])
+
+
+def test_fast_hs256_token_is_rejected_with_another_key():
+    token = _fast_hs256_encode({"email": "user@example.com", "exp": int(time.time()) + 60})
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt.decode(token, SECRET_KEY + b"-other", algorithms=["HS256"])